@@ -20,16 +20,22 @@ PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Google Pollen from a config entry."""
+    # Reuse Home Assistant's shared session so refreshes share its connection pool
     session = async_get_clientsession(hass)
-    client = GooglePollenApiClient(entry.data[CONF_API_KEY], session)
-
-    coordinator = GooglePollenDataUpdateCoordinator(
-        hass,
-        client,
+    if session.connector is not None:
+        _LOGGER.debug(
+            "Using shared client session (limit_per_host=%s)",
+            session.connector.limit_per_host,
+        )
+    client = GooglePollenApiClient(
+        entry.data[CONF_API_KEY],
+        session,
         latitude=entry.data[CONF_LATITUDE],
         longitude=entry.data[CONF_LONGITUDE],
     )
 
+    coordinator = GooglePollenDataUpdateCoordinator(hass, client)
+
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
@@ -41,14 +41,16 @@ class GooglePollenConfigFlow(ConfigFlow, domain=DOMAIN):
 
             # Validate the API key
             session = async_get_clientsession(self.hass)
-            client = GooglePollenApiClient(user_input[CONF_API_KEY], session)
+            client = GooglePollenApiClient(
+                user_input[CONF_API_KEY],
+                session,
+                latitude=user_input[CONF_LATITUDE],
+                longitude=user_input[CONF_LONGITUDE],
+                days=1,
+            )
 
             try:
-                await client.async_get_forecast(
-                    latitude=user_input[CONF_LATITUDE],
-                    longitude=user_input[CONF_LONGITUDE],
-                    days=1,
-                )
+                await client.async_get_forecast()
             except GooglePollenApiAuthError:
                 errors["base"] = "invalid_auth"
             except GooglePollenApiConnectionError:
@@ -19,6 +19,9 @@ DEFAULT_FORECAST_DAYS: Final = 5
 # Update interval
 DEFAULT_UPDATE_INTERVAL: Final = timedelta(hours=6)
 
+# How long the last good forecast may be served while the API is unreachable
+STALE_DATA_MAX_AGE: Final = timedelta(hours=24)
+
 # Pollen types
 POLLEN_TYPE_GRASS: Final = "GRASS"
 POLLEN_TYPE_TREE: Final = "TREE"
@@ -3,24 +3,123 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+import sys
+from datetime import date, datetime, timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
     GooglePollenApiClient,
     GooglePollenApiConnectionError,
     GooglePollenApiError,
-    PollenForecast,
 )
-from .const import DEFAULT_FORECAST_DAYS, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import (
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    POLLEN_TYPES,
+    SENSOR_TYPE_CATEGORY,
+    SENSOR_TYPE_INDEX,
+    STALE_DATA_MAX_AGE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class GooglePollenDataUpdateCoordinator(DataUpdateCoordinator[PollenForecast]):
+def get_pollen_index(pollen_info: dict[str, Any] | None) -> int | None:
+    """Get the pollen index value for a pollen type."""
+    if pollen_info:
+        index_info = pollen_info.get("indexInfo")
+        if index_info and index_info.get("value") is not None:
+            return index_info["value"]
+        # Pollen type exists but no index data (out of season) - return 0
+        return 0
+    return None
+
+
+def get_pollen_category(pollen_info: dict[str, Any] | None) -> str | None:
+    """Get the pollen category for a pollen type."""
+    if pollen_info:
+        index_info = pollen_info.get("indexInfo")
+        if index_info and index_info.get("category"):
+            return index_info["category"]
+        # Pollen type exists but no index data (out of season) - return "None"
+        return "None"
+    return None
+
+
+def build_data_index(forecast: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Build a per pollen type view of the forecast for the sensors.
+
+    Sensor values are stored under their SENSOR_TYPE_* key so entities can
+    read them with a single lookup.
+    """
+    daily = [
+        {
+            "date": date(
+                day_data["date"]["year"],
+                day_data["date"]["month"],
+                day_data["date"]["day"],
+            ).isoformat(),
+            "pollen_types": {
+                sys.intern(pollen_type.get("code", "")): pollen_type
+                for pollen_type in day_data.get("pollenTypeInfo", [])
+            },
+        }
+        for day_data in forecast.get("dailyInfo", [])
+    ]
+    data_index: dict[str, dict[str, Any]] = {}
+
+    for pollen_type in POLLEN_TYPES:
+        today = daily[0]["pollen_types"].get(pollen_type) if daily else None
+
+        # Frozen so the attributes of every refresh share one read-only object
+        upcoming = tuple(
+            {
+                "date": day_info["date"],
+                "index": day_pollen["indexInfo"].get("value"),
+                "category": day_pollen["indexInfo"].get("category"),
+            }
+            for day_info in daily[1:]  # Skip today
+            if (day_pollen := day_info["pollen_types"].get(pollen_type))
+            and day_pollen.get("indexInfo")
+        )
+
+        data_index[pollen_type] = {
+            SENSOR_TYPE_INDEX: get_pollen_index(today),
+            SENSOR_TYPE_CATEGORY: get_pollen_category(today),
+            "attributes": _build_attributes(today, upcoming),
+        }
+
+    return data_index
+
+
+def _build_attributes(
+    pollen_info: dict[str, Any] | None, upcoming: tuple[dict[str, Any], ...]
+) -> dict[str, Any]:
+    """Build the extra state attributes for a pollen type."""
+    attrs: dict[str, Any] = {}
+
+    if pollen_info:
+        attrs["in_season"] = pollen_info.get("inSeason", False)
+        if pollen_info.get("healthRecommendations"):
+            attrs["health_recommendations"] = pollen_info["healthRecommendations"]
+        index_info = pollen_info.get("indexInfo")
+        if index_info:
+            attrs["index_description"] = index_info.get("indexDescription")
+            if index_info.get("color"):
+                attrs["color"] = index_info["color"]
+
+    if upcoming:
+        attrs["forecast"] = upcoming
+
+    return attrs
+
+
+class GooglePollenDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Google Pollen data."""
 
     config_entry: ConfigEntry
@@ -29,8 +128,6 @@ class GooglePollenDataUpdateCoordinator(DataUpdateCoordinator[PollenForecast]):
         self,
         hass: HomeAssistant,
         client: GooglePollenApiClient,
-        latitude: float,
-        longitude: float,
         update_interval: timedelta = DEFAULT_UPDATE_INTERVAL,
     ) -> None:
         """Initialize the coordinator."""
@@ -39,33 +136,48 @@ class GooglePollenDataUpdateCoordinator(DataUpdateCoordinator[PollenForecast]):
             _LOGGER,
             name=DOMAIN,
             update_interval=update_interval,
+            # Only notify entities when the forecast actually changed
+            always_update=False,
         )
         self.client = client
-        self.latitude = latitude
-        self.longitude = longitude
+        self.data_index: dict[str, dict[str, Any]] = {}
+        self._last_good: dict[str, Any] | None = None
+        self._last_good_time: datetime | None = None
 
-    async def _async_update_data(self) -> PollenForecast:
+    async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API."""
-        _LOGGER.debug("Fetching pollen data for %s, %s", self.latitude, self.longitude)
+        _LOGGER.debug("Fetching pollen data")
         try:
-            forecast = await self.client.async_get_forecast(
-                latitude=self.latitude,
-                longitude=self.longitude,
-                days=DEFAULT_FORECAST_DAYS,
-            )
-            _LOGGER.debug("Got forecast with region: %s", forecast.region_code)
-            if forecast.daily_info:
-                today = forecast.daily_info[0]
-                _LOGGER.debug("Pollen types: %s", list(today.pollen_types.keys()))
-                for code, info in today.pollen_types.items():
+            forecast = await self.client.async_get_forecast()
+            if forecast is self.data:
+                _LOGGER.debug("Forecast unchanged since last update")
+                self._last_good_time = dt_util.utcnow()
+                return forecast
+            _LOGGER.debug("Got forecast with region: %s", forecast.get("regionCode"))
+            if daily_info := forecast.get("dailyInfo"):
+                for info in daily_info[0].get("pollenTypeInfo", []):
                     _LOGGER.debug(
                         "  %s: in_season=%s, has_index=%s",
-                        code,
-                        info.in_season,
-                        info.index_info is not None,
+                        info.get("code"),
+                        info.get("inSeason", False),
+                        "indexInfo" in info,
                     )
+            self.data_index = build_data_index(forecast)
+            self._last_good = forecast
+            self._last_good_time = dt_util.utcnow()
             return forecast
         except GooglePollenApiConnectionError as err:
+            if (
+                self._last_good is not None
+                and self._last_good_time is not None
+                and dt_util.utcnow() - self._last_good_time < STALE_DATA_MAX_AGE
+            ):
+                _LOGGER.warning(
+                    "Error communicating with API, using data from %s: %s",
+                    self._last_good_time,
+                    err,
+                )
+                return self._last_good
             raise UpdateFailed(f"Error communicating with API: {err}") from err
         except GooglePollenApiError as err:
             raise UpdateFailed(f"Error fetching pollen data: {err}") from err
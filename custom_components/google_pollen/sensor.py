@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -17,8 +16,13 @@ from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import PollenForecast
-from .const import ATTRIBUTION, DOMAIN, POLLEN_TYPES
+from .const import (
+    ATTRIBUTION,
+    DOMAIN,
+    POLLEN_TYPES,
+    SENSOR_TYPE_CATEGORY,
+    SENSOR_TYPE_INDEX,
+)
 from .coordinator import GooglePollenDataUpdateCoordinator
 
 
@@ -26,81 +30,9 @@ from .coordinator import GooglePollenDataUpdateCoordinator
 class GooglePollenSensorEntityDescription(SensorEntityDescription):
     """Describes Google Pollen sensor entity."""
 
-    value_fn: Callable[[PollenForecast], Any]
-    extra_state_attributes_fn: Callable[[PollenForecast], dict[str, Any]] | None = None
-
-
-def get_pollen_index(forecast: PollenForecast, pollen_type: str) -> int | None:
-    """Get the pollen index value for a pollen type."""
-    if not forecast.daily_info:
-        return None
-    today = forecast.daily_info[0]
-    pollen_info = today.pollen_types.get(pollen_type)
-    if pollen_info:
-        if pollen_info.index_info and pollen_info.index_info.value is not None:
-            return pollen_info.index_info.value
-        # Pollen type exists but no index data (out of season) - return 0
-        return 0
-    return None
-
-
-def get_pollen_category(forecast: PollenForecast, pollen_type: str) -> str | None:
-    """Get the pollen category for a pollen type."""
-    if not forecast.daily_info:
-        return None
-    today = forecast.daily_info[0]
-    pollen_info = today.pollen_types.get(pollen_type)
-    if pollen_info:
-        if pollen_info.index_info and pollen_info.index_info.category:
-            return pollen_info.index_info.category
-        # Pollen type exists but no index data (out of season) - return "None"
-        return "None"
-    return None
-
-
-def get_pollen_in_season(forecast: PollenForecast, pollen_type: str) -> bool | None:
-    """Get whether a pollen type is in season."""
-    if not forecast.daily_info:
-        return None
-    today = forecast.daily_info[0]
-    pollen_info = today.pollen_types.get(pollen_type)
-    if pollen_info:
-        return pollen_info.in_season
-    return None
-
-
-def get_pollen_attributes(forecast: PollenForecast, pollen_type: str) -> dict[str, Any]:
-    """Get extra attributes for a pollen type."""
-    attrs: dict[str, Any] = {}
-    if not forecast.daily_info:
-        return attrs
-
-    today = forecast.daily_info[0]
-    pollen_info = today.pollen_types.get(pollen_type)
-
-    if pollen_info:
-        attrs["in_season"] = pollen_info.in_season
-        if pollen_info.health_recommendations:
-            attrs["health_recommendations"] = pollen_info.health_recommendations
-        if pollen_info.index_info:
-            attrs["index_description"] = pollen_info.index_info.description
-            if pollen_info.index_info.color:
-                attrs["color"] = pollen_info.index_info.color
-
-    # Add forecast for upcoming days
-    forecast_data = []
-    for day_info in forecast.daily_info[1:]:  # Skip today
-        day_pollen = day_info.pollen_types.get(pollen_type)
-        if day_pollen and day_pollen.index_info:
-            forecast_data.append({
-                "date": day_info.date,
-                "index": day_pollen.index_info.value,
-                "category": day_pollen.index_info.category,
-            })
-    if forecast_data:
-        attrs["forecast"] = forecast_data
-
-    return attrs
+    pollen_type: str
+    kind: str
+    has_attributes: bool = False
 
 
 def create_sensor_descriptions() -> list[GooglePollenSensorEntityDescription]:
@@ -111,9 +43,6 @@ def create_sensor_descriptions() -> list[GooglePollenSensorEntityDescription]:
         pollen_type_lower = pollen_type.lower()
         pollen_type_title = pollen_type.title()
 
-        # Capture pollen_type in closure
-        pt = pollen_type
-
         # Index sensor
         descriptions.append(
             GooglePollenSensorEntityDescription(
@@ -123,8 +52,9 @@ def create_sensor_descriptions() -> list[GooglePollenSensorEntityDescription]:
                 icon="mdi:flower-pollen",
                 state_class=SensorStateClass.MEASUREMENT,
                 native_unit_of_measurement="UPI",
-                value_fn=lambda f, _pt=pt: get_pollen_index(f, _pt),
-                extra_state_attributes_fn=lambda f, _pt=pt: get_pollen_attributes(f, _pt),
+                pollen_type=pollen_type,
+                kind=SENSOR_TYPE_INDEX,
+                has_attributes=True,
             )
         )
 
@@ -135,7 +65,8 @@ def create_sensor_descriptions() -> list[GooglePollenSensorEntityDescription]:
                 translation_key=f"{pollen_type_lower}_category",
                 name=f"{pollen_type_title} Pollen Level",
                 icon="mdi:flower-pollen-outline",
-                value_fn=lambda f, _pt=pt: get_pollen_category(f, _pt),
+                pollen_type=pollen_type,
+                kind=SENSOR_TYPE_CATEGORY,
             )
         )
 
@@ -153,8 +84,18 @@ async def async_setup_entry(
     """Set up Google Pollen sensors based on a config entry."""
     coordinator: GooglePollenDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # All sensors of an entry belong to the same device
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Google Pollen",
+        manufacturer="Google",
+        model="Pollen API",
+        entry_type=DeviceEntryType.SERVICE,
+        configuration_url="https://developers.google.com/maps/documentation/pollen",
+    )
+
     async_add_entities(
-        GooglePollenSensor(coordinator, description, entry)
+        GooglePollenSensor(coordinator, description, entry, device_info)
         for description in SENSOR_DESCRIPTIONS
     )
 
@@ -173,34 +114,35 @@ class GooglePollenSensor(
         coordinator: GooglePollenDataUpdateCoordinator,
         description: GooglePollenSensorEntityDescription,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = device_info
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Google Pollen",
-            manufacturer="Google",
-            model="Pollen API",
-            entry_type=DeviceEntryType.SERVICE,
-            configuration_url="https://developers.google.com/maps/documentation/pollen",
-        )
+    def _value(self) -> Any:
+        """Return the precomputed value for this sensor's kind."""
+        description = self.entity_description
+        return self.coordinator.data_index[description.pollen_type][description.kind]
+
+    def _attrs(self) -> dict[str, Any]:
+        """Return the precomputed attributes for this sensor's pollen type."""
+        return self.coordinator.data_index[self.entity_description.pollen_type][
+            "attributes"
+        ]
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
         if self.coordinator.data is None:
             return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self._value()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        if (
-            self.coordinator.data is None
-            or self.entity_description.extra_state_attributes_fn is None
-        ):
+        if self.coordinator.data is None or not self.entity_description.has_attributes:
             return None
-        return self.entity_description.extra_state_attributes_fn(self.coordinator.data)
+        return self._attrs()